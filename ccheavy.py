@@ -1,12 +1,15 @@
-import json
+# Heavier stdlib modules (json, shutil, subprocess, tempfile, datetime) are
+# imported lazily inside the functions that need them so that --help and an
+# early exit from interactive mode never pay for them
+import asyncio
+import atexit
+import contextlib
+import functools
+import os
+import random
 import re
-import shutil
-import subprocess
 import sys
-import tempfile
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -32,6 +35,47 @@ except ImportError:
 __all__ = ["CCHeavy", "Fore", "Style"]
 
 
+# Precompiled patterns for generate_folder_name; avoids the re-cache probe
+# on every call
+_RE_NONALNUM = re.compile(r"[^a-z0-9 ]")
+_RE_SPACES = re.compile(r" +")
+_RE_DASHES = re.compile(r"-+")
+_RE_TRAILING_WORD = re.compile(r"-[^-]*$")
+
+# Jittered backoff schedule for agent retries; starts well under the old
+# fixed 1 s sleep and caps the number of attempts
+_BACKOFFS = (0.1, 0.3, 0.8)
+
+
+def _emit(*lines):
+    """Write related output lines with a single stdout call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _atomic_write(path, data):
+    """Write a file via a temp name and os.replace so readers never see a
+    partially written copy"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data.encode() if isinstance(data, str) else data)
+    os.replace(tmp, path)
+
+
+# All tags emitted by the orchestrator, matched in one sweep of the session log
+_ALL_TAGS = re.compile(
+    r"\[BEGIN_(PLAN|PLAN_JSON|FINAL|SYNTH_PROMPT|RA_[1-8])\](.*?)\[END_\1\]",
+    re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_block(start_tag: str, end_tag: str) -> re.Pattern:
+    """Compile (and cache) the extraction pattern for a tag pair"""
+    return re.compile(
+        f"{re.escape(start_tag)}(.*?){re.escape(end_tag)}", re.DOTALL
+    )
+
+
 class CCHeavy:
     """Cursor CLI Heavy Research System"""
 
@@ -47,26 +91,32 @@ class CCHeavy:
         self.output_dir = ""
         self.output_dir_abs = ""
         self.ext = "md"
+        # Cached string form of the assistants dir for the per-RA loops
+        self._assist_dir = ""
         # Dynamic focuses decided by orchestrator {assistant_index: focus}
         self.assistant_focuses = {}
         # Synthesis prompt provided by orchestrator
         self.synthesis_prompt = ""
+        # Event loop shared by planning, research, and synthesis phases
+        self._loop = None
+        # Session-wide temp run directory, used when no working dir is given
+        self._session_tmpdir = ""
 
     def generate_folder_name(self, query: str, max_length: int = 60) -> str:
         """Generate a folder-friendly name from a query"""
         # Convert to lowercase and replace special chars with spaces
-        clean = re.sub(r"[^a-z0-9 ]", " ", query.lower())
+        clean = _RE_NONALNUM.sub(" ", query.lower())
 
         # Replace spaces with hyphens and remove multiple hyphens
-        clean = re.sub(r" +", "-", clean)
-        clean = re.sub(r"-+", "-", clean)
+        clean = _RE_SPACES.sub("-", clean)
+        clean = _RE_DASHES.sub("-", clean)
         clean = clean.strip("-")
 
         # Truncate if too long
         if len(clean) > max_length:
             clean = clean[:max_length]
             # Remove trailing partial word
-            clean = re.sub(r"-[^-]*$", "", clean)
+            clean = _RE_TRAILING_WORD.sub("", clean)
 
         return clean
 
@@ -86,11 +136,13 @@ class CCHeavy:
 
     def print_banner(self):
         """Print the application banner"""
-        print(f"{Fore.CYAN}")
-        print("╔════════════════════════════════════════╗")
-        print("║       Cursor CLI Heavy Research        ║")
-        print("╚════════════════════════════════════════╝")
-        print(f"{Style.RESET_ALL}")
+        _emit(
+            f"{Fore.CYAN}",
+            "╔════════════════════════════════════════╗",
+            "║       Cursor CLI Heavy Research        ║",
+            "╚════════════════════════════════════════╝",
+            f"{Style.RESET_ALL}",
+        )
 
     def interactive_mode(self) -> Tuple[str, str, str]:
         """Run interactive mode to collect user input"""
@@ -132,16 +184,22 @@ class CCHeavy:
 
     def setup_directories(self):
         """Setup output directories"""
+        import shutil
+        import tempfile
+        from datetime import datetime
+
         folder_name = self.generate_folder_name(self.query)
         date = datetime.now().strftime("%Y-%m-%d")
         self.output_dir = f"./outputs/{date}-{folder_name}"
 
-        # Create directories
-        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
-        Path(f"{self.output_dir}/assistants").mkdir(exist_ok=True)
+        # Create directories (skip the mkdir syscalls on repeated invocations)
+        assistants_path = Path(f"{self.output_dir}/assistants")
+        if not assistants_path.exists():
+            assistants_path.mkdir(parents=True)
 
         # Get absolute path
         self.output_dir_abs = Path(self.output_dir).resolve()
+        self._assist_dir = str(self.output_dir_abs / "assistants")
 
         # Setup working directory
         if self.working_dir:
@@ -158,22 +216,18 @@ class CCHeavy:
         # Set file extension
         self.ext = "md" if self.output_format == "markdown" else "txt"
 
-    def run_cursor_agent(
-        self,
-        prompt_content: str,
-        output_file: str,
-        error_file: Optional[str] = None,
-        run_dir: Optional[str] = None,
-    ) -> bool:
-        """Run cursor-agent with given prompt and capture output"""
-        try:
-            # Determine run directory
-            if run_dir is None:
-                if self.working_dir_abs:
-                    run_dir = self.working_dir_abs
-                else:
-                    run_dir = tempfile.mkdtemp()
+        # One shared temp run directory for the whole session; agents don't
+        # share files, so per-assistant mkdtemp/rmtree cycles are wasted work
+        if not self.working_dir_abs:
+            self._session_tmpdir = tempfile.mkdtemp(prefix="ccheavy-")
+            atexit.register(shutil.rmtree, self._session_tmpdir, ignore_errors=True)
+
+    async def _spawn_agent(self, prompt_content, out_f, err_f, run_dir) -> int:
+        """Spawn cursor-agent writing stdout/stderr to already-open handles.
 
+        Returns the child's exit code, or -1 if the spawn itself failed.
+        """
+        try:
             # Build command
             cmd = [
                 "cursor-agent",
@@ -185,27 +239,82 @@ class CCHeavy:
                 "text",
             ]
 
-            # Run command
-            with open(output_file, "w") as out_f:
-                error_output = None
-                if error_file:
-                    error_output = open(error_file, "w")
+            import shutil
+
+            agent_path = shutil.which("cursor-agent")
+            if agent_path is None:
+                raise FileNotFoundError("cursor-agent not found on PATH")
+
+            # Route the child's streams straight to the files; no action for
+            # stderr means the child inherits ours, matching stderr=None
+            out_f.flush()
+            file_actions = [(os.POSIX_SPAWN_DUP2, out_f.fileno(), 1)]
+            if err_f is not None:
+                err_f.flush()
+                file_actions.append((os.POSIX_SPAWN_DUP2, err_f.fileno(), 2))
+
+            # posix_spawn avoids fork's page-table copy of this (potentially
+            # large) parent but takes no cwd, so chdir around the spawn; there
+            # is no await in between and the loop runs on a single thread, so
+            # nothing else can observe the changed directory
+            parent_cwd = os.getcwd()
+            os.chdir(run_dir)
+            try:
+                pid = os.posix_spawn(
+                    agent_path, cmd, os.environ, file_actions=file_actions
+                )
+            finally:
+                os.chdir(parent_cwd)
 
-                try:
-                    result = subprocess.run(
-                        cmd, cwd=run_dir, stdout=out_f, stderr=error_output, text=True
-                    )
-                    return result.returncode == 0
-                finally:
-                    if error_output:
-                        error_output.close()
+            # Non-blocking reap so sibling agents keep being serviced
+            while True:
+                wpid, status = os.waitpid(pid, os.WNOHANG)
+                if wpid != 0:
+                    return os.waitstatus_to_exitcode(status)
+                await asyncio.sleep(0.05)
 
         except Exception as e:
-            with open(output_file, "a") as f:
-                f.write(f"\nError running cursor-agent: {e}")
-            return False
+            out_f.write(f"\nError running cursor-agent: {e}".encode())
+            return -1
 
-    def run_parallel_research(self):
+    async def _run_cursor_agent(
+        self,
+        prompt_content: str,
+        output_file: str,
+        error_file: Optional[str] = None,
+        run_dir: Optional[str] = None,
+    ) -> bool:
+        """Run cursor-agent with given prompt and capture output"""
+        # Determine run directory
+        if run_dir is None:
+            run_dir = self.working_dir_abs or self._session_tmpdir
+
+        # 1 MiB binary buffering so our own writes reach the kernel in large
+        # chunks; ExitStack closes whichever handles were actually opened
+        with contextlib.ExitStack() as stack:
+            out_f = stack.enter_context(open(output_file, "wb", buffering=1 << 20))
+            err_f = (
+                stack.enter_context(open(error_file, "wb", buffering=1 << 20))
+                if error_file
+                else None
+            )
+            returncode = await self._spawn_agent(prompt_content, out_f, err_f, run_dir)
+            return returncode == 0
+
+    def run_cursor_agent(
+        self,
+        prompt_content: str,
+        output_file: str,
+        error_file: Optional[str] = None,
+        run_dir: Optional[str] = None,
+    ) -> bool:
+        """Synchronous wrapper for single-shot agent runs outside the fan-out loop"""
+        coro = self._run_cursor_agent(prompt_content, output_file, error_file, run_dir)
+        if self._loop is not None:
+            return self._loop.run_until_complete(coro)
+        return asyncio.run(coro)
+
+    async def _run_parallel_research_async(self):
         """Run parallel research with multiple cursor-agent workers"""
         print(
             f"{Fore.YELLOW}Spawning {self.parallel_agents} cursor-agent workers...{Style.RESET_ALL}"
@@ -213,24 +322,26 @@ class CCHeavy:
 
         # Write research plan
         plan_file = self.output_dir_abs / f"research-plan.{self.ext}"
-        with open(plan_file, "w") as f:
-            f.write("# Research Plan\n\n")
-            f.write(f"**Query:** {self.query}\n\n")
-            f.write(f"**Mode:** Parallel ({self.parallel_agents} assistants)\n\n")
-            f.write("## Assistant Roles\n")
-            for i in range(1, self.parallel_agents + 1):
-                focus = self.assistant_focuses.get(i) or self.get_focus_for_index(i)
-                f.write(f"- RA-{i}: {focus}\n")
-
-        # Launch workers concurrently
-        with ThreadPoolExecutor(max_workers=self.parallel_agents) as executor:
-            futures = []
-
-            for i in range(1, self.parallel_agents + 1):
-                focus = self.assistant_focuses.get(i) or self.get_focus_for_index(i)
-
-                # Create prompt content
-                prompt_content = f"""You are Research Assistant RA-{i} working in parallel on the following query:
+        plan_lines = [
+            "# Research Plan\n\n",
+            f"**Query:** {self.query}\n\n",
+            f"**Mode:** Parallel ({self.parallel_agents} assistants)\n\n",
+            "## Assistant Roles\n",
+        ]
+        for i in range(1, self.parallel_agents + 1):
+            focus = self.assistant_focuses.get(i) or self.get_focus_for_index(i)
+            plan_lines.append(f"- RA-{i}: {focus}\n")
+        _atomic_write(plan_file, "".join(plan_lines))
+
+        # Launch workers concurrently on the event loop
+        tasks = []
+        launched = []
+
+        for i in range(1, self.parallel_agents + 1):
+            focus = self.assistant_focuses.get(i) or self.get_focus_for_index(i)
+
+            # Create prompt content
+            prompt_content = f"""You are Research Assistant RA-{i} working in parallel on the following query:
 
 "{self.query}"
 
@@ -242,129 +353,127 @@ Instructions:
 - No meta commentary, no planning output, no placeholders
 - Output only the final report content as {self.output_format}"""
 
-                output_file = (
-                    self.output_dir_abs / f"assistants/ra-{i}-findings.{self.ext}"
-                )
-                error_file = self.output_dir_abs / f"assistants/ra-{i}-stderr.log"
+            output_file = f"{self._assist_dir}/ra-{i}-findings.{self.ext}"
+            error_file = f"{self._assist_dir}/ra-{i}-stderr.log"
 
-                # Determine and display run directory for this agent
-                agent_run_dir = (
-                    self.working_dir_abs
-                    if self.working_dir_abs
-                    else "temporary directory"
-                )
+            # Determine and display run directory for this agent
+            agent_run_dir = (
+                self.working_dir_abs
+                if self.working_dir_abs
+                else "temporary directory"
+            )
 
-                # Submit task
-                future = executor.submit(
-                    self._run_assistant_with_retry,
-                    prompt_content,
-                    str(output_file),
-                    str(error_file),
-                    i,
+            # Schedule task
+            tasks.append(
+                asyncio.ensure_future(
+                    self._run_assistant_with_retry(
+                        prompt_content, output_file, error_file, i
+                    )
                 )
-                futures.append(future)
+            )
 
-                print(
-                    f"{Fore.GREEN}✓ Launched RA{i} ({focus}) from: {agent_run_dir}{Style.RESET_ALL}"
-                )
+            launched.append(
+                f"{Fore.GREEN}✓ Launched RA{i} ({focus}) from: {agent_run_dir}{Style.RESET_ALL}"
+            )
 
-            # Wait for completion
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"{Fore.RED}Assistant task failed: {e}{Style.RESET_ALL}")
+        # One stdout write for the whole launch batch
+        _emit(*launched)
+
+        # Collect findings as each assistant finishes so the synthesis input
+        # is fully assembled by the time the slowest agent returns
+        synth_parts = {}
+        for future in asyncio.as_completed(tasks):
+            try:
+                num, findings = await future
+                synth_parts[num] = findings
+            except Exception as e:
+                print(f"{Fore.RED}Assistant task failed: {e}{Style.RESET_ALL}")
 
         print(f"{Fore.CYAN}All assistants have completed.{Style.RESET_ALL}")
 
         # Synthesis step
-        self._run_synthesis()
+        await self._run_synthesis(synth_parts)
 
-    def _run_assistant_with_retry(
+    async def _run_assistant_with_retry(
         self, prompt_content: str, output_file: str, error_file: str, assistant_num: int
-    ):
-        """Run assistant with retry logic"""
-        # Determine run directory for this assistant
-        run_dir = None
-        if self.working_dir_abs:
-            run_dir = self.working_dir_abs
-        else:
-            # Create temp directory for this specific assistant if no working dir specified
-            run_dir = tempfile.mkdtemp()
+    ) -> Tuple[int, str]:
+        """Run assistant with retry logic; returns (assistant number, findings)"""
+        # Run from the working directory, or the shared session temp directory
+        run_dir = self.working_dir_abs or self._session_tmpdir
+
+        # Keep both handles open across the retry so the empty-output check is
+        # a single fstat on the live descriptor instead of a full re-read
+        with open(output_file, "wb", buffering=1 << 20) as out_f, open(
+            error_file, "wb", buffering=1 << 20
+        ) as err_f:
+            for attempt in range(len(_BACKOFFS) + 1):
+                returncode = await self._spawn_agent(
+                    prompt_content, out_f, err_f, run_dir
+                )
 
-        # First attempt
-        success = self.run_cursor_agent(
-            prompt_content, output_file, error_file, run_dir
-        )
+                # A clean exit with actual output means we're done; the size
+                # fast-path plus a bounded head read also catches
+                # whitespace-only transcripts without an O(size) read
+                out_f.flush()
+                if returncode == 0 and os.fstat(out_f.fileno()).st_size > 0:
+                    with open(output_file, "rb") as rf:
+                        if rf.read(4096).strip():
+                            break
 
-        # Check if output is empty or whitespace only
-        try:
-            with open(output_file, "r") as f:
-                content = f.read().strip()
-            if not content:
-                # Retry once
-                time.sleep(1)
-                success = self.run_cursor_agent(
-                    prompt_content, output_file, error_file, run_dir
-                )
-        except FileNotFoundError:
-            success = False
+                # CLI misuse is not transient; retrying would just hammer it
+                if returncode == 2:
+                    break
+
+                if attempt < len(_BACKOFFS):
+                    await asyncio.sleep(
+                        _BACKOFFS[attempt] + random.random() * 0.05
+                    )
+                    # Drop any partial transcript so the retry starts from a
+                    # clean file, as the per-attempt "w" reopen used to do
+                    out_f.seek(0)
+                    out_f.truncate()
+
+            success = returncode == 0
 
         if not success:
             with open(output_file, "a") as f:
                 f.write(f"\nRA-{assistant_num}: cursor-agent failed. See {error_file}")
 
-        # Clean up temp directory if we created one
-        if not self.working_dir_abs and run_dir:
-            try:
-                shutil.rmtree(run_dir)
-            except Exception:
-                pass  # Ignore cleanup errors
+        # Hand the findings back in memory so synthesis input can be built
+        # while slower siblings are still running
+        with open(output_file, "r") as f:
+            return assistant_num, f.read()
 
-    def _run_synthesis(self):
-        """Run synthesis of all assistant reports"""
+    async def _run_synthesis(self, synth_parts):
+        """Run synthesis of assistant reports collected during the fan-out"""
         synth_input = self.output_dir_abs / "synthesis-input.txt"
 
-        with open(synth_input, "w") as f:
-            if self.synthesis_prompt:
-                f.write(self.synthesis_prompt + "\n\n")
-            else:
-                f.write(
-                    f"You are a senior analyst. Synthesize the following assistant reports into a single comprehensive {self.output_format} analysis with an executive summary, key findings, areas of agreement/disagreement, and recommended next steps. Cite with inline markdown links.\n\n"
-                )
-
-            for i in range(1, self.parallel_agents + 1):
-                f.write(f"\n===== BEGIN RA-{i} =====\n")
-
-                findings_file = (
-                    self.output_dir_abs / f"assistants/ra-{i}-findings.{self.ext}"
-                )
-                try:
-                    with open(findings_file, "r") as rf:
-                        f.write(rf.read())
-                except FileNotFoundError:
-                    f.write(f"RA-{i} output not found")
+        # Findings arrived in memory as each assistant completed, so the
+        # prompt is assembled without touching the RA files again; the
+        # on-disk copy is a single buffered write kept only for debugging
+        parts = []
+        if self.synthesis_prompt:
+            parts.append(self.synthesis_prompt + "\n\n")
+        else:
+            parts.append(
+                f"You are a senior analyst. Synthesize the following assistant reports into a single comprehensive {self.output_format} analysis with an executive summary, key findings, areas of agreement/disagreement, and recommended next steps. Cite with inline markdown links.\n\n"
+            )
 
-                f.write(f"\n===== END RA-{i} =====\n\n")
+        for i in range(1, self.parallel_agents + 1):
+            parts.append(f"\n===== BEGIN RA-{i} =====\n")
+            parts.append(synth_parts.get(i, f"RA-{i} output not found"))
+            parts.append(f"\n===== END RA-{i} =====\n\n")
 
-        # Run synthesis
-        with open(synth_input, "r") as f:
-            synth_prompt = f.read()
+        synth_prompt = "".join(parts)
+        _atomic_write(synth_input, synth_prompt)
 
         final_output = self.output_dir_abs / f"final-analysis.{self.ext}"
 
-        # Use specified working directory or create temp directory for synthesis
-        synth_run_dir = (
-            self.working_dir_abs if self.working_dir_abs else tempfile.mkdtemp()
+        # Use specified working directory or the shared session temp directory
+        synth_run_dir = self.working_dir_abs or self._session_tmpdir
+        await self._run_cursor_agent(
+            synth_prompt, str(final_output), run_dir=synth_run_dir
         )
-        self.run_cursor_agent(synth_prompt, str(final_output), run_dir=synth_run_dir)
-
-        # Clean up temp directory if we created one
-        if not self.working_dir_abs and synth_run_dir:
-            try:
-                shutil.rmtree(synth_run_dir)
-            except Exception:
-                pass  # Ignore cleanup errors
 
         print(
             f"{Fore.GREEN}Parallel research complete. Outputs saved under: {self.output_dir_abs}{Style.RESET_ALL}"
@@ -423,15 +532,13 @@ Begin by analyzing the query and creating your research plan."""
         else:
             prompt_file = self.output_dir_abs / "orchestration-prompt.txt"
 
-        with open(prompt_file, "w") as f:
-            f.write(content)
+        _atomic_write(prompt_file, content)
 
         return prompt_file
 
     def extract_block(self, content: str, start_tag: str, end_tag: str) -> str:
         """Extract content between start and end tags"""
-        pattern = f"{re.escape(start_tag)}(.*?){re.escape(end_tag)}"
-        match = re.search(pattern, content, re.DOTALL)
+        match = _compile_block(start_tag, end_tag).search(content)
         return match.group(1).strip() if match else ""
 
     def parse_session_output(self, session_file: Path):
@@ -442,35 +549,47 @@ Begin by analyzing the query and creating your research plan."""
         except FileNotFoundError:
             return
 
+        # One pass over the log; calling extract_block per tag would sweep the
+        # whole (potentially multi-MB) content a dozen times
+        blocks = {m.group(1): m.group(2).strip() for m in _ALL_TAGS.finditer(content)}
+
         # Extract plan
-        plan_content = self.extract_block(content, "[BEGIN_PLAN]", "[END_PLAN]")
+        plan_content = blocks.get("PLAN", "")
         if plan_content:
-            with open(self.output_dir_abs / f"research-plan.{self.ext}", "w") as f:
-                f.write(plan_content)
+            _atomic_write(
+                self.output_dir_abs / f"research-plan.{self.ext}", plan_content
+            )
 
-        # Extract assistant findings
+        # Extract assistant findings; create the directory once, outside the
+        # loop, and only when it is actually missing
+        assistants_dir = Path(self._assist_dir)
+        if not assistants_dir.exists():
+            assistants_dir.mkdir()
         for i in range(1, self.max_assistants + 1):
-            ra_content = self.extract_block(content, f"[BEGIN_RA_{i}]", f"[END_RA_{i}]")
+            ra_content = blocks.get(f"RA_{i}", "")
             if ra_content:
-                (self.output_dir_abs / "assistants").mkdir(exist_ok=True)
-                with open(
-                    self.output_dir_abs / f"assistants/ra-{i}-findings.{self.ext}", "w"
-                ) as f:
-                    f.write(ra_content)
+                _atomic_write(
+                    f"{self._assist_dir}/ra-{i}-findings.{self.ext}", ra_content
+                )
 
         # Extract final analysis
-        final_content = self.extract_block(content, "[BEGIN_FINAL]", "[END_FINAL]")
+        final_content = blocks.get("FINAL", "")
         if final_content:
-            with open(self.output_dir_abs / f"final-analysis.{self.ext}", "w") as f:
-                f.write(final_content)
+            _atomic_write(
+                self.output_dir_abs / f"final-analysis.{self.ext}", final_content
+            )
 
         # Extract JSON plan to set dynamic agents and focuses
         try:
-            plan_json = self.extract_block(
-                content, "[BEGIN_PLAN_JSON]", "[END_PLAN_JSON]"
-            )
+            plan_json = blocks.get("PLAN_JSON", "")
             if plan_json:
-                data = json.loads(plan_json)
+                try:
+                    import orjson as _json
+                except ImportError:
+                    # Fallback if orjson not available
+                    import json as _json
+
+                data = _json.loads(plan_json)
                 count = int(data.get("assistant_count", 0))
                 if 2 <= count <= self.max_assistants:
                     self.parallel_agents = count
@@ -495,11 +614,9 @@ Begin by analyzing the query and creating your research plan."""
                 if parsed_focuses:
                     self.assistant_focuses = parsed_focuses
 
-            synth_prompt = self.extract_block(
-                content, "[BEGIN_SYNTH_PROMPT]", "[END_SYNTH_PROMPT]"
-            )
+            synth_prompt = blocks.get("SYNTH_PROMPT", "")
             if synth_prompt:
-                self.synthesis_prompt = synth_prompt.strip()
+                self.synthesis_prompt = synth_prompt
         except Exception:
             # Silently ignore malformed JSON; fallback logic will apply
             pass
@@ -536,50 +653,96 @@ Constraints:
 Now produce the JSON plan. After the JSON block, also print a tailored synthesis instruction block between [BEGIN_SYNTH_PROMPT] and [END_SYNTH_PROMPT].
 """
 
-        # Use specified working directory or a temp directory
-        run_dir = self.working_dir_abs if self.working_dir_abs else tempfile.mkdtemp()
+        # Use specified working directory or the shared session temp directory
+        run_dir = self.working_dir_abs or self._session_tmpdir
         session_file = self.output_dir_abs / "planning-session.log"
+        success = self.run_cursor_agent(prompt, str(session_file), run_dir=run_dir)
+        if success:
+            self.parse_session_output(session_file)
+            if not self.synthesis_prompt:
+                print(
+                    f"{Fore.YELLOW}Planning step did not provide a synthesis prompt. Retrying once...{Style.RESET_ALL}"
+                )
+                # Retry once, with a short jittered delay
+                time.sleep(_BACKOFFS[0] + random.random() * 0.05)
+                success_retry = self.run_cursor_agent(
+                    prompt, str(session_file), run_dir=run_dir
+                )
+                if success_retry:
+                    self.parse_session_output(session_file)
+            if not self.synthesis_prompt:
+                raise RuntimeError(
+                    "Planning orchestrator did not provide required synthesis prompt."
+                )
+
+    def _check_cursor_agent(self) -> bool:
+        """Verify cursor-agent is installed, caching the probe per binary.
+
+        The --help probe forks the full CLI on every startup; remember a
+        successful probe keyed on the resolved path and its mtime so later
+        runs skip it until the binary changes.
+        """
+        import json
+        import shutil
+        import subprocess
+
+        path = shutil.which("cursor-agent")
+        if not path:
+            return False
+
         try:
-            success = self.run_cursor_agent(prompt, str(session_file), run_dir=run_dir)
-            if success:
-                self.parse_session_output(session_file)
-                if not self.synthesis_prompt:
-                    print(
-                        f"{Fore.YELLOW}Planning step did not provide a synthesis prompt. Retrying once...{Style.RESET_ALL}"
-                    )
-                    # Retry once
-                    success_retry = self.run_cursor_agent(
-                        prompt, str(session_file), run_dir=run_dir
-                    )
-                    if success_retry:
-                        self.parse_session_output(session_file)
-                if not self.synthesis_prompt:
-                    raise RuntimeError(
-                        "Planning orchestrator did not provide required synthesis prompt."
-                    )
-        finally:
-            if not self.working_dir_abs and run_dir:
-                try:
-                    shutil.rmtree(run_dir)
-                except Exception:
-                    pass
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return False
+
+        cache_file = Path.home() / ".cache" / "cursor-cli-heavy" / "probe.json"
+        cache = {}
+        try:
+            with open(cache_file, "r") as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+            if cache.get(path) == mtime:
+                return True
+        except (OSError, ValueError):
+            cache = {}
+
+        try:
+            # The help text is discarded anyway; DEVNULL avoids the pipes and
+            # the buffering that capture_output sets up
+            subprocess.run(
+                [path, "--help"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+
+        cache[path] = mtime
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass  # The cache is only an optimization
+
+        return True
 
     def _print_manual_instructions(self, prompt_file: Path):
         """Print manual run instructions"""
-        print(f"\n{Fore.CYAN}══ Manual Run Instructions ══{Style.RESET_ALL}")
-        print(f"\n{Fore.YELLOW}To start:{Style.RESET_ALL}")
-
         if self.working_dir_abs:
-            print(
-                f'1. Run: {Fore.GREEN}cd "{self.working_dir_abs}" && cursor-agent -p "$(cat "{prompt_file}")" --model "gpt-5" --output-format text{Style.RESET_ALL}'
-            )
+            run_line = f'1. Run: {Fore.GREEN}cd "{self.working_dir_abs}" && cursor-agent -p "$(cat "{prompt_file}")" --model "gpt-5" --output-format text{Style.RESET_ALL}'
         else:
-            print(
-                f'1. Run: {Fore.GREEN}cursor-agent -p "$(cat "{prompt_file}")" --model "gpt-5" --output-format text{Style.RESET_ALL}'
-            )
-
-        print("\n2. The agent will print outputs. Save the blocks to files under:")
-        print(f"   {Fore.BLUE}{self.output_dir_abs}{Style.RESET_ALL}")
+            run_line = f'1. Run: {Fore.GREEN}cursor-agent -p "$(cat "{prompt_file}")" --model "gpt-5" --output-format text{Style.RESET_ALL}'
+
+        _emit(
+            f"\n{Fore.CYAN}══ Manual Run Instructions ══{Style.RESET_ALL}",
+            f"\n{Fore.YELLOW}To start:{Style.RESET_ALL}",
+            run_line,
+            "\n2. The agent will print outputs. Save the blocks to files under:",
+            f"   {Fore.BLUE}{self.output_dir_abs}{Style.RESET_ALL}",
+        )
 
     def run(self, args):
         """Main execution method"""
@@ -614,10 +777,8 @@ Now produce the JSON plan. After the JSON block, also print a tailored synthesis
                 self._print_manual_instructions(prompt_file)
                 return
 
-        # Check if cursor-agent is available
-        try:
-            subprocess.run(["cursor-agent", "--help"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Check if cursor-agent is available (probe result is cached)
+        if not self._check_cursor_agent():
             print(
                 f"{Fore.RED}cursor-agent command not found. Please ensure Cursor CLI is installed.{Style.RESET_ALL}"
             )
@@ -626,22 +787,28 @@ Now produce the JSON plan. After the JSON block, also print a tailored synthesis
             )
             return
 
-        # Run planning orchestrator to decide count and focuses
-        print(f"{Fore.YELLOW}Planning assistant configuration...{Style.RESET_ALL}")
-        self.run_planning_orchestrator()
-
-        # Fallbacks if orchestrator did not set values
-        if not (2 <= self.parallel_agents <= self.max_assistants):
-            self.parallel_agents = 4
-        if not self.assistant_focuses:
-            # Seed with defaults up to decided count
-            self.assistant_focuses = {
-                i: self.get_focus_for_index(i)
-                for i in range(1, self.parallel_agents + 1)
-            }
-
-        # Run research
-        self.run_parallel_research()
+        # One event loop reused for planning, all assistants, and synthesis
+        self._loop = asyncio.new_event_loop()
+        try:
+            # Run planning orchestrator to decide count and focuses
+            print(f"{Fore.YELLOW}Planning assistant configuration...{Style.RESET_ALL}")
+            self.run_planning_orchestrator()
+
+            # Fallbacks if orchestrator did not set values
+            if not (2 <= self.parallel_agents <= self.max_assistants):
+                self.parallel_agents = 4
+            if not self.assistant_focuses:
+                # Seed with defaults up to decided count
+                self.assistant_focuses = {
+                    i: self.get_focus_for_index(i)
+                    for i in range(1, self.parallel_agents + 1)
+                }
+
+            # Run research
+            self._loop.run_until_complete(self._run_parallel_research_async())
+        finally:
+            self._loop.close()
+            self._loop = None
 
         # Final message
         print(